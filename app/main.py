@@ -7,11 +7,13 @@ service and exposes a simple `/health` endpoint.  All configuration is
 driven by environment variables to make deployment on Railway as simple as
 setting a few secrets.
 
-The wrapper assumes that the upstream package has been installed via pip
+The wrapper assumes that the upstream repository is importable, either from
+the clone the Dockerfile places on PYTHONPATH or installed via pip
 (`pip install git+https://github.com/georgeantonopoulos/Basecamp-MCP-Server.git`).
-Upon import the upstream server registers its FastMCP tools, and we then
-expose the Streamable HTTP app on `/mcp`.  The OAuth app is mounted on
-`/oauth` if available.
+`create_app()` imports the upstream server, which registers its FastMCP
+tools, and then exposes the Streamable HTTP app on `/mcp`.  The OAuth app
+is mounted on `/oauth` if available; it is loaded on the first request to
+that prefix.
 
 Environment variables used:
 
@@ -24,6 +26,9 @@ Environment variables used:
 * `TOKEN_FILENAME` – name of the token JSON file inside `TOKEN_DIR`.  Defaults
   to `oauth_tokens.json`.  The upstream code expects this file to exist
   after completing the OAuth flow.
+* `TOKEN_FILE` – optional full path of the token JSON file.  When set it
+  takes precedence over `TOKEN_DIR` and `TOKEN_FILENAME`.  A relative path is
+  resolved against the working directory at startup (`/app` in the image).
 
 The wrapper does **not** implement any Basecamp logic itself.  Instead it
 delegates entirely to the upstream package, ensuring that you always benefit
@@ -32,56 +37,91 @@ from upstream updates without having to port code manually.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib
 import importlib.util
 import logging
 import os
 import sys
-from typing import Optional
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Optional
 
-from fastapi import FastAPI
-from fastapi.middleware.wsgi import WSGIMiddleware
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from starlette.types import ASGIApp, Receive, Scope, Send
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def _set_working_directory() -> None:
-    """Ensure the token directory exists and set it as the current working directory.
+@dataclass(frozen=True, slots=True)
+class WrapperConfig:
+    """Environment-derived settings for the wrapper, read once at import."""
 
-    The upstream server writes and reads its token file relative to the current
-    working directory.  Setting CWD to `TOKEN_DIR` ensures that the file ends
-    up in the desired location.
+    token_dir: str
+    token_filename: str
+    token_path: str
+    public_base: Optional[str]
+    redirect_uri: Optional[str]
+
+
+def _load_config() -> WrapperConfig:
+    """Read all wrapper environment variables in one pass.
+
+    Defaults match the Dockerfile and .env.example.
     """
-    token_dir = os.environ.get("TOKEN_DIR", "/app/data")
-    os.makedirs(token_dir, exist_ok=True)
-    os.chdir(token_dir)
-
-# Compute and set the BASECAMP_REDIRECT_URI environment variable if not
-# explicitly provided.  The upstream OAuth app expects this value to
-# match the redirect URL registered with Basecamp.  If a public base
-# URL (PUBLIC_BASE_URL) has been supplied, derive the callback URL
-# automatically by appending "/oauth/callback".  This allows users to
-# configure only the PUBLIC_BASE_URL in Railway.
-def _configure_redirect_uri() -> None:
-    # Only set the redirect URI if it hasn't been defined and a public
-    # base URL is available.  Do nothing if either condition is false.
-    if os.environ.get("BASECAMP_REDIRECT_URI"):
-        return
-    public_base = os.environ.get("PUBLIC_BASE_URL")
-    if not public_base:
+    env = os.environ
+    token_file = env.get("TOKEN_FILE")
+    if token_file:
+        # A full path overrides TOKEN_DIR/TOKEN_FILENAME.  A relative one is
+        # resolved now, against the startup working directory, so the patched
+        # upstream constant never depends on a later chdir.
+        token_path = os.path.abspath(token_file)
+        token_dir, token_filename = os.path.split(token_path)
+    else:
+        token_dir = env.get("TOKEN_DIR", "/app/data")
+        token_filename = env.get("TOKEN_FILENAME", "oauth_tokens.json")
+        token_path = os.path.join(token_dir, token_filename)
+    public_base = env.get("PUBLIC_BASE_URL") or None
+    redirect_uri = env.get("BASECAMP_REDIRECT_URI") or None
+    if redirect_uri is None and public_base:
+        # The upstream OAuth app defines its callback route at '/auth/callback'
+        # (relative to its mount path).  Because we mount the Flask app at
+        # '/oauth', the effective callback URL is '/oauth/auth/callback'.  See
+        # upstream `oauth_app.py` for route definitions【712093837881706†L190-L263】.
+        # Strip any trailing slash on the base URL to avoid double slashes.
+        redirect_uri = f"{public_base.rstrip('/')}/oauth/auth/callback"
+    return WrapperConfig(
+        token_dir=token_dir,
+        token_filename=token_filename,
+        token_path=token_path,
+        public_base=public_base,
+        redirect_uri=redirect_uri,
+    )
+
+
+# Set the BASECAMP_REDIRECT_URI environment variable if not explicitly
+# provided.  The upstream OAuth app expects this value to match the redirect
+# URL registered with Basecamp.  If a public base URL (PUBLIC_BASE_URL) has
+# been supplied, `_load_config` derives the callback URL automatically.  This
+# allows users to configure only the PUBLIC_BASE_URL in Railway.
+def _configure_redirect_uri(cfg: WrapperConfig) -> None:
+    # Nothing to do if neither an explicit redirect URI nor a public base URL
+    # is available.
+    if cfg.redirect_uri is None:
         return
-    # Ensure no trailing slash on the base URL to avoid double slashes.
-    base = public_base.rstrip("/")
-    # The upstream OAuth app defines its callback route at '/auth/callback' (relative
-    # to its mount path).  Because we mount the Flask app at '/oauth', the
-    # effective callback URL is '/oauth/auth/callback'.  See upstream
-    # `oauth_app.py` for route definitions【712093837881706†L190-L263】.  We
-    # therefore compute the redirect URI accordingly.
-    os.environ["BASECAMP_REDIRECT_URI"] = f"{base}/oauth/auth/callback"
+    # Skip the write (and the putenv behind it) when the value is already in
+    # place, e.g. when it was provided explicitly or set by an earlier call.
+    env = os.environ
+    if env.get("BASECAMP_REDIRECT_URI") != cfg.redirect_uri:
+        env["BASECAMP_REDIRECT_URI"] = cfg.redirect_uri
 
 
-def _configure_token_storage() -> None:
+def _configure_token_storage(cfg: WrapperConfig) -> None:
     """
     Patch the upstream token_storage module to write the OAuth tokens to our
     desired location.  The upstream implementation writes tokens into the
@@ -93,46 +133,90 @@ def _configure_token_storage() -> None:
     TOKEN_DIR, ensuring they survive restarts.  If TOKEN_DIR is not set,
     defaults to /app/data (matching earlier examples).  See upstream
     implementation for details on TOKEN_FILE usage【568162562896650†L16-L19】.
+
+    The working directory is deliberately left alone: with TOKEN_FILE set to
+    an absolute path nothing needs to resolve relative to TOKEN_DIR.
     """
-    # Determine target directory and file name.  Use defaults consistent with
-    # the Dockerfile and .env.example if environment variables are unset.
-    token_dir = os.environ.get("TOKEN_DIR", "/app/data")
-    token_filename = os.environ.get("TOKEN_FILENAME", "oauth_tokens.json")
-    # Ensure directory exists
-    os.makedirs(token_dir, exist_ok=True)
-    # Construct full path
-    token_path = os.path.join(token_dir, token_filename)
+    # Ensure the directory exists.  A single mkdir covers the common cases
+    # (volume already mounted, or only the last component missing); fall
+    # back to makedirs for deeper paths.
     try:
-        # Import the upstream module and patch the TOKEN_FILE constant
-        import importlib
-        token_storage = importlib.import_module("token_storage")
+        os.mkdir(cfg.token_dir)
+    except FileExistsError:
+        # Only an existing directory is fine; fail at startup if the path is
+        # a regular file rather than on the first token write.
+        if not os.path.isdir(cfg.token_dir):
+            raise
+    except FileNotFoundError:
+        os.makedirs(cfg.token_dir, exist_ok=True)
+    token_path = cfg.token_path
+    try:
+        # Patch the upstream module's TOKEN_FILE constant.  It is normally
+        # already imported by basecamp_fastmcp, so check sys.modules first.
+        token_storage = sys.modules.get("token_storage") or importlib.import_module(
+            "token_storage"
+        )
         token_storage.TOKEN_FILE = token_path
-        logger.info(f"Token storage configured at: {token_path}")
+        logger.info("Token storage configured at: %s", token_path)
     except Exception as e:
         # If import fails, log the error for debugging
-        logger.warning(f"Could not configure token storage: {e}")
-
-
-def _find_upstream_file(filename: str) -> str:
-    """Search sys.path for a file belonging to the upstream package.
-
-    When installed via pip the upstream repository files live in one of the
-    entries on sys.path.  They may be at the top level (e.g. site-packages)
-    or inside a subfolder named after the repository.  This function searches
-    both possibilities and returns the first hit.
+        logger.warning("Could not configure token storage: %s", e)
+
+
+@functools.lru_cache(maxsize=None)
+def _find_upstream_file(
+    filename: str,
+    _join=os.path.join,
+    _isfile=os.path.isfile,
+    _scandir=os.scandir,
+    _paths=sys.path,
+) -> str:
+    """Locate a file belonging to the upstream package.
+
+    The interpreter's cached path finders are asked first, both for a
+    top-level module (e.g. on PYTHONPATH or in site-packages) and for one
+    inside a package named after the repository.  Only if neither resolves do
+    we fall back to scanning sys.path by hand.  Results are memoized.  The
+    underscore parameters bind the path helpers locally for that scan and
+    are not meant to be passed by callers.
     """
-    for base in sys.path:
-        candidate = os.path.join(base, filename)
-        if os.path.isfile(candidate):
-            return candidate
-        candidate2 = os.path.join(base, "Basecamp-MCP-Server", filename)
-        if os.path.isfile(candidate2):
-            return candidate2
+    module_name = filename.removesuffix(".py")
+    for candidate_name in (module_name, f"Basecamp_MCP_Server.{module_name}"):
+        try:
+            spec = importlib.util.find_spec(candidate_name)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is not None and spec.origin and _isfile(spec.origin):
+            return spec.origin
+    # One directory listing per sys.path entry covers both layouts; only the
+    # subfolder candidate needs an extra stat.
+    for base in _paths:
+        subfolder = None
+        try:
+            with _scandir(base or ".") as entries:
+                for entry in entries:
+                    if entry.name == filename and entry.is_file():
+                        return entry.path
+                    if entry.name == "Basecamp-MCP-Server" and entry.is_dir():
+                        subfolder = entry.path
+        except OSError:
+            continue
+        if subfolder is not None:
+            candidate = _join(subfolder, filename)
+            if _isfile(candidate):
+                return candidate
     raise RuntimeError(f"Could not find {filename} in sys.path; is the upstream package installed?")
 
 
 def _load_module(path: str, name: str) -> object:
-    """Dynamically import a module from an arbitrary file path."""
+    """Dynamically import a module from an arbitrary file path.
+
+    A module already registered under `name` is returned as is, so repeated
+    calls never execute the upstream file twice.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
     spec = importlib.util.spec_from_file_location(name, path)
     if spec is None or spec.loader is None:
         raise RuntimeError(f"Cannot load module {name} from {path}")
@@ -142,17 +226,42 @@ def _load_module(path: str, name: str) -> object:
     return module
 
 
+def _import_upstream(module_name: str, fallback_name: str) -> object:
+    """Import an upstream module, preferring the regular import machinery.
+
+    Importing by name lets CPython reuse its finder cache and the cached
+    bytecode.  Loading from an explicit file path (registered as
+    `fallback_name`) is kept only for layouts the finders cannot resolve.
+    Raises RuntimeError if the file cannot be found either.
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        # Only fall back if the upstream module itself is missing; errors
+        # raised by its own imports should surface unchanged.
+        if e.name != module_name:
+            raise
+    path = _find_upstream_file(f"{module_name}.py")
+    return _load_module(path, fallback_name)
+
+
 def _load_fastmcp() -> object:
     """Locate and load the upstream FastMCP server."""
-    mcp_path = _find_upstream_file("basecamp_fastmcp.py")
-    logger.info(f"Loading FastMCP from: {mcp_path}")
-    module = _load_module(mcp_path, "basecamp_fastmcp_wrapper")
+    module = _import_upstream("basecamp_fastmcp", "basecamp_fastmcp_wrapper")
+    logger.info("Loaded FastMCP from: %s", module.__file__)
+    # Tool registration happens through decorators while the module above is
+    # executed, so there is no separate registration step that could be
+    # skipped or replayed from an on-disk cache; the bytecode cache is the
+    # only reusable artefact of this import.
+    #
     # The upstream file typically defines either `mcp` or `server` holding
-    # the FastMCP instance.  Search for common attribute names.
+    # the FastMCP instance.  Search for common names directly in the module
+    # namespace; only module globals are of interest here.
+    namespace = vars(module)
     for name in ("mcp", "server", "app"):
-        mcp_obj = getattr(module, name, None)
+        mcp_obj = namespace.get(name)
         if mcp_obj is not None:
-            logger.info(f"Found FastMCP instance as '{name}'")
+            logger.info("Found FastMCP instance as '%s'", name)
             return mcp_obj
     raise RuntimeError(
         "The upstream FastMCP file does not expose an MCP instance. Expected one of 'mcp', 'server' or 'app'."
@@ -162,22 +271,12 @@ def _load_fastmcp() -> object:
 def _load_oauth_app() -> Optional[object]:
     """Locate and load the upstream OAuth FastAPI app, if available."""
     try:
-        oauth_path = _find_upstream_file("oauth_app.py")
+        module = _import_upstream("oauth_app", "basecamp_oauth_wrapper")
     except RuntimeError:
         return None
-    module = _load_module(oauth_path, "basecamp_oauth_wrapper")
     return getattr(module, "app", None)
 
 
-# Configure environment and working directory up front
-_set_working_directory()
-
-_configure_redirect_uri()
-
-_configure_token_storage()
-
-
-
 # ---------------------------------------------------------------------------
 # Mount the upstream MCP HTTP application
 #
@@ -187,32 +286,47 @@ _configure_token_storage()
 # under `/mcp` we end up with a doubled path (`/mcp/mcp/`), which causes
 # 404 errors.  To avoid this, we explicitly set the `path` parameter to
 # "/" (empty prefix) so that the returned ASGI app serves the MCP API at
-# its root.  When mounted at `/mcp`, the final URL becomes `/mcp/` (with
-# Starlette automatically handling the redirect from `/mcp` to `/mcp/`).
-mcp_instance = _load_fastmcp()
-
-def _create_mcp_app() -> object:
+# its root.  When mounted at `/mcp`, the final URL becomes `/mcp/`.  The bare
+# `/mcp` path is routed to the same app explicitly (see `_MCPRootAlias`)
+# rather than through Starlette's trailing-slash redirect, which would break
+# POSTs from MCP clients behind Railway's proxy.
+def _create_mcp_app(
+    mcp_instance: object,
+    http_app_method: Optional[Callable[..., object]],
+    streamable_method: Optional[Callable[..., object]],
+) -> object:
     """Create the FastMCP ASGI app.
 
     The upstream FastMCP instance exposes two methods for HTTP deployment:
-    `http_app()` and the older `streamable_http_app()`. We call these without
-    any path parameter to let FastMCP use its default path (/mcp), and then
-    we mount the entire app at root (/) so the final URL is /mcp.
+    `http_app()` and the older `streamable_http_app()`. Either way the app is
+    configured to serve the MCP API at its own root (/), and we mount it at
+    /mcp so the final URL is /mcp.  The caller resolves both methods once
+    and passes them in.
+
+    The MCP app's lifespan starts a session manager that can only run once.
+    With the `mcp` SDK's FastMCP (the declared dependency) that manager is
+    cached on the instance and shared by every app built from it, so only
+    one wrapper per process can be started; see `create_app`.
 
     Returns the ASGI application.
     """
     # Prefer the modern `http_app` if available.  It implements the
     # Streamable HTTP transport with SSE polling support as of FastMCP
     # v2.14.0.  Fall back to `streamable_http_app` if necessary.
-    if hasattr(mcp_instance, "http_app"):
-        logger.info("Using mcp_instance.http_app()")
-        app = mcp_instance.http_app()
-        logger.info("Created MCP app with default path")
+    if http_app_method is not None:
+        logger.info("Using mcp_instance.http_app(path='/')")
+        app = http_app_method(path="/")
+        logger.info("Created MCP app with root path")
         return app
-    if hasattr(mcp_instance, "streamable_http_app"):
+    if streamable_method is not None:
+        # `streamable_http_app()` takes no path argument; the route is read
+        # from the instance settings instead.
+        settings = getattr(mcp_instance, "settings", None)
+        if settings is not None and hasattr(settings, "streamable_http_path"):
+            settings.streamable_http_path = "/"
         logger.info("Using mcp_instance.streamable_http_app()")
-        app = mcp_instance.streamable_http_app()
-        logger.info("Created MCP app with default path")
+        app = streamable_method()
+        logger.info("Created MCP app with root path")
         return app
     
     # Last resort: check if mcp_instance itself is already an ASGI app
@@ -224,94 +338,272 @@ def _create_mcp_app() -> object:
         "Upstream FastMCP instance does not provide a HTTP app (no http_app/streamable_http_app)"
     )
 
-# Instantiate the MCP ASGI app.
-try:
-    mcp_app = _create_mcp_app()
-    logger.info(f"MCP app created successfully: {type(mcp_app)}")
-except Exception as e:
-    logger.error(f"Failed to create MCP app: {e}", exc_info=True)
-    raise
-
-# Create the parent FastAPI app. We need to use the MCP app's lifespan
-# context manager to ensure the session manager is properly initialized.
-# We'll extract and use it if available.
-from contextlib import asynccontextmanager
-from typing import AsyncIterator
-
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    """Lifespan context that initializes the MCP session manager."""
-    # Check if mcp_app has a lifespan context we can use
-    if hasattr(mcp_app, "router") and hasattr(mcp_app.router, "lifespan_context"):
-        # Use the MCP app's lifespan
-        async with mcp_app.router.lifespan_context(mcp_app) as state:
-            yield state
-    else:
-        # No lifespan available, just yield
-        yield
 
-app = FastAPI(title="Basecamp MCP (Railway Wrapper)", lifespan=lifespan)
+def _mcp_lifespan(
+    mcp_app: object,
+) -> Callable[[FastAPI], AbstractAsyncContextManager[None]]:
+    """Build the parent app's lifespan around the MCP app's own lifespan.
 
+    We need to use the MCP app's lifespan context manager to ensure the
+    session manager is properly initialized.  We'll extract and use it if
+    available.
+    """
 
-@app.get("/health")
-def health() -> dict[str, bool]:
-    """Simple health endpoint used by Railway to determine service readiness."""
-    return {"ok": True}
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """Lifespan context that initializes the MCP session manager."""
+        # Check if mcp_app has a lifespan context we can use
+        if hasattr(mcp_app, "router") and hasattr(mcp_app.router, "lifespan_context"):
+            # Use the MCP app's lifespan
+            async with mcp_app.router.lifespan_context(mcp_app) as state:
+                yield state
+        else:
+            # No lifespan available, just yield
+            yield
+
+    return lifespan
+
+
+# Static payload for /mcp/info.  It is serialised once in `create_app`.
+_MCP_INFO = {
+    "name": "Basecamp MCP Server",
+    "version": "1.0.0",
+    "protocol": "streamable-http",
+    "transport": "sse",
+    "endpoint": "/mcp",
+    "instructions": {
+        "connection": "Connect via SSE with Accept: text/event-stream header",
+        "example_curl": "curl -N -H 'Accept: text/event-stream' https://your-domain.railway.app/mcp",
+        "langflow": "Add as MCP server with URL: https://your-domain.railway.app/mcp",
+    }
+}
 
 
-@app.get("/debug/info")
-def debug_info() -> dict:
-    """Debug endpoint to check what's loaded."""
-    mcp_routes = []
-    if hasattr(mcp_app, "routes"):
-        mcp_routes = [{"path": getattr(r, "path", "unknown"), "name": getattr(r, "name", "unknown")} for r in mcp_app.routes]
-    
-    return {
+# The upstream OAuth routes live on /oauth.  Loading the Flask app (and the
+# WSGI adapter) is deferred until the first request under /oauth so that
+# processes which never see an OAuth request do not pay for it at startup.
+# The load runs in a worker thread so that it does not stall the event loop;
+# the lock makes concurrent first requests wait for that single load.
+_oauth_asgi: Optional[ASGIApp] = None
+_oauth_lock = asyncio.Lock()
+
+
+def _build_oauth_asgi() -> ASGIApp:
+    """Load the upstream OAuth app and wrap it for mounting under FastAPI."""
+    oauth_app = _load_oauth_app()
+    if oauth_app is None:
+        from starlette.responses import PlainTextResponse
+
+        logger.warning("Upstream OAuth app not available; /oauth will return 404")
+        return PlainTextResponse("Not Found", status_code=404)
+    # The upstream OAuth app is a Flask (WSGI) application.  FastAPI requires
+    # an ASGI interface, so wrap it with a2wsgi's WSGIMiddleware, which is a
+    # faster bridge than the one shipped with Starlette.
+    from a2wsgi import WSGIMiddleware
+
+    logger.info("OAuth app loaded for /oauth")
+    return WSGIMiddleware(oauth_app)
+
+
+async def _oauth_lazy(scope: Scope, receive: Receive, send: Send) -> None:
+    """ASGI shim that installs the real OAuth app on first use.
+
+    The synchronous import of the upstream Flask app is offloaded to a thread,
+    keeping `/health` and `/mcp` responsive while it runs.
+    """
+    global _oauth_asgi
+    if _oauth_asgi is None:
+        async with _oauth_lock:
+            if _oauth_asgi is None:
+                import anyio.to_thread
+
+                _oauth_asgi = await anyio.to_thread.run_sync(_build_oauth_asgi)
+    await _oauth_asgi(scope, receive, send)
+
+
+class _MCPRootAlias:
+    """Serve the bare `/mcp` path from the app mounted at `/mcp`.
+
+    Starlette's `Mount("/mcp")` only matches `/mcp/...`; this rewrites the
+    scope the same way the mount would for `/mcp/`.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        root_path = scope.get("root_path", "")
+        scope = dict(scope, path=scope["path"] + "/", root_path=root_path + "/mcp")
+        await self.app(scope, receive, send)
+
+
+def _configure_environment() -> WrapperConfig:
+    """Load the config, set the redirect URI and patch the token location.
+
+    Used where upstream modules are imported without going through
+    `_load_upstream`, which performs the same steps around the FastMCP import.
+    """
+    config = _load_config()
+
+    _configure_redirect_uri(config)
+
+    _configure_token_storage(config)
+
+    return config
+
+
+def _load_upstream() -> tuple[WrapperConfig, object]:
+    """Configure the environment and load the upstream FastMCP instance."""
+    # Configure environment up front; upstream may read it at import time.
+    config = _load_config()
+
+    _configure_redirect_uri(config)
+
+    mcp_instance = _load_fastmcp()
+
+    # Upstream reads TOKEN_FILE when tokens are accessed, not at import, so
+    # patching it after loading FastMCP is early enough.
+    _configure_token_storage(config)
+
+    return config, mcp_instance
+
+
+# The MCP app mounted by `create_app()`, recorded so that the module-level
+# `mcp_app` attribute refers to the app actually being served.
+_mounted_mcp_app: Optional[object] = None
+
+
+def create_app() -> FastAPI:
+    """Build the wrapper application.
+
+    This is the ASGI factory passed to uvicorn (`app.main:create_app
+    --factory`).  Importing this module only defines helpers; configuring the
+    environment, loading the upstream server and importing FastAPI all happen
+    here.
+
+    It can be called once per process: the upstream MCP session manager
+    cannot be started a second time, so a second call raises RuntimeError
+    up front instead of failing later inside the lifespan.
+    """
+    global _mounted_mcp_app
+    if _mounted_mcp_app is not None:
+        raise RuntimeError(
+            "create_app() has already built the wrapper in this process; the "
+            "upstream MCP session manager can only be started once"
+        )
+
+    import orjson
+    from fastapi import FastAPI
+    from fastapi.responses import ORJSONResponse, Response
+    from starlette.routing import Route
+
+    config, mcp_instance = _load_upstream()
+
+    # Resolve the HTTP app factory methods once.
+    http_app_method = getattr(mcp_instance, "http_app", None)
+    streamable_method = getattr(mcp_instance, "streamable_http_app", None)
+
+    # Instantiate the MCP ASGI app.
+    try:
+        mcp_app = _create_mcp_app(mcp_instance, http_app_method, streamable_method)
+        logger.info("MCP app created successfully: %s", type(mcp_app))
+    except Exception as e:
+        logger.error("Failed to create MCP app: %s", e, exc_info=True)
+        raise
+
+    app = FastAPI(
+        title="Basecamp MCP (Railway Wrapper)",
+        lifespan=_mcp_lifespan(mcp_app),
+        default_response_class=ORJSONResponse,
+    )
+
+    # The payloads below never change, so the responses are built once and
+    # the same instance is returned on every request.  /health in particular
+    # is polled by Railway.
+    health_response = Response(orjson.dumps({"ok": True}), media_type="application/json")
+    mcp_info_response = Response(orjson.dumps(_MCP_INFO), media_type="application/json")
+
+    # Snapshot of what was loaded.  None of it changes after startup, so the
+    # attribute listings in particular are computed here rather than per
+    # request.
+    debug_snapshot = {
         "mcp_instance_type": str(type(mcp_instance)),
+        "mcp_instance_attrs": tuple(a for a in dir(mcp_instance) if a[:1] != "_"),
         "mcp_app_type": str(type(mcp_app)),
-        "mcp_routes": mcp_routes,
-        "has_http_app": hasattr(mcp_instance, "http_app"),
-        "has_streamable_http_app": hasattr(mcp_instance, "streamable_http_app"),
+        "mcp_app_attrs": tuple(a for a in dir(mcp_app) if a[:1] != "_"),
+        "mcp_routes": [
+            {"path": getattr(r, "path", "unknown"), "name": getattr(r, "name", "unknown")}
+            for r in getattr(mcp_app, "routes", ())
+        ],
+        "has_http_app": http_app_method is not None,
+        "has_streamable_http_app": streamable_method is not None,
+        "token_path": config.token_path,
+        "redirect_uri": config.redirect_uri,
         "info": "MCP endpoint is at /mcp - use SSE with Accept: text/event-stream header",
     }
 
+    # Simple health endpoint used by Railway to determine service readiness.
+    # It is a bare Starlette route serving the prebuilt response directly, and
+    # sits first in the routing table, so probes skip FastAPI's request
+    # handling and the scan over the other routes.
+    app.router.routes.insert(0, Route("/health", health_response, methods=["GET"], name="health"))
+
+    @app.get("/debug/info")
+    def debug_info() -> dict:
+        """Debug endpoint to check what's loaded."""
+        return debug_snapshot
+
+    @app.get("/mcp/info")
+    def mcp_info():
+        """Info endpoint for MCP - explains how to connect."""
+        return mcp_info_response
+
+    app.mount("/oauth", _oauth_lazy)
+    logger.info("OAuth app mounted lazily at /oauth")
+
+    # Mount the MCP sub-application under /mcp.  The MCP app serves its
+    # routes at its own root, so there is no double prefix, and there is no
+    # catch-all mount at / for unrelated requests to fall through to.  Our
+    # own routes (/health, /debug/info, /mcp/info) are defined BEFORE
+    # mounting, so they take precedence in Starlette's routing.
+    try:
+        app.router.routes.append(Route("/mcp", _MCPRootAlias(mcp_app)))
+        app.mount("/mcp", mcp_app)
+        logger.info("MCP app mounted at /mcp")
+    except Exception as e:
+        logger.error("Failed to mount MCP app: %s", e, exc_info=True)
+        raise
 
-@app.get("/mcp/info")
-def mcp_info() -> dict:
-    """Info endpoint for MCP - explains how to connect."""
-    return {
-        "name": "Basecamp MCP Server",
-        "version": "1.0.0",
-        "protocol": "streamable-http",
-        "transport": "sse",
-        "endpoint": "/mcp",
-        "instructions": {
-            "connection": "Connect via SSE with Accept: text/event-stream header",
-            "example_curl": "curl -N -H 'Accept: text/event-stream' https://your-domain.railway.app/mcp",
-            "langflow": "Add as MCP server with URL: https://your-domain.railway.app/mcp",
-        }
-    }
+    _mounted_mcp_app = mcp_app
+    return app
 
 
-# Mount the upstream OAuth routes on /oauth if present  
-oauth_app = _load_oauth_app()
-if oauth_app is not None:
-    # The upstream OAuth app is a Flask (WSGI) application.  FastAPI requires
-    # an ASGI interface, so wrap it with WSGIMiddleware before mounting.
-    try:
-        app.mount("/oauth", WSGIMiddleware(oauth_app))
-        logger.info("OAuth app mounted at /oauth")
-    except Exception as e:
-        logger.warning(f"Failed to mount OAuth app: {e}")
-
-
-# Mount the MCP sub-application at root. The MCP app has routes with /mcp prefix,
-# so they'll be accessible at /mcp. We mount at root to avoid double-prefix.
-# Our own routes (/health, /debug/info) are defined BEFORE mounting, so they
-# take precedence in Starlette's routing.
-try:
-    app.mount("/", mcp_app)
-    logger.info("MCP app mounted at / (MCP endpoints at /mcp)")
-except Exception as e:
-    logger.error(f"Failed to mount MCP app: {e}", exc_info=True)
-    raise
+def __getattr__(name: str) -> object:
+    """Materialise the heavyweight module attributes on first access.
+
+    `app` builds the wrapper via `create_app()`, so `uvicorn app.main:app`
+    keeps working alongside the factory form.  `mcp_app` is the MCP app
+    mounted by `create_app()` if a wrapper has been built; otherwise a
+    standalone MCP app is built without the wrapper.  `oauth_app` exposes
+    the upstream Flask app.  Standalone loads set the redirect URI and the
+    token file location before importing upstream.  Each value is stored in
+    the module namespace, so this runs once per name.
+    """
+    if name == "app":
+        value = create_app()
+    elif name == "mcp_app" and _mounted_mcp_app is not None:
+        value = _mounted_mcp_app
+    elif name == "mcp_app":
+        _, mcp_instance = _load_upstream()
+        value = _create_mcp_app(
+            mcp_instance,
+            getattr(mcp_instance, "http_app", None),
+            getattr(mcp_instance, "streamable_http_app", None),
+        )
+    elif name == "oauth_app":
+        _configure_environment()
+        value = _load_oauth_app()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value